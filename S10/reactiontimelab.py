@@ -1,15 +1,25 @@
 import pygame
-import time
 import random
 import json
 import os
+import stat
+import tempfile
 from enum import Enum
+from functools import lru_cache
 
 pygame.init()
 ANCHO, ALTO = 1920, 1080
 pantalla = pygame.display.set_mode((ANCHO, ALTO))
 pygame.display.set_caption("LaboratorioTiempoReaccion")
 reloj = pygame.time.Clock()
+# Solo llegan a la cola los eventos que usa el juego; el movimiento del ratón
+# no se encola y el resaltado de botones se consulta una vez por frame.
+# TEXTINPUT es necesario: pygame lo usa para rellenar KEYDOWN.unicode con
+# letras como ñ o á
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.TEXTINPUT,
+                          pygame.MOUSEBUTTONDOWN, pygame.MOUSEWHEEL,
+                          pygame.VIDEOEXPOSE])
 
 # -------------------------------
 # Rutas de imágenes
@@ -38,6 +48,17 @@ def cargar_fuente(tamaño):
 
 FUENTES = {t: cargar_fuente(t) for t in [24,28,32,36,40,48,64,80,100]}
 
+def obtener_fuente(tamaño):
+    """
+    Devuelve la fuente del tamaño pedido.
+    Si no estaba cargada se carga una sola vez y se guarda en FUENTES.
+    """
+    fuente = FUENTES.get(tamaño)
+    if fuente is None:
+        fuente = cargar_fuente(tamaño)
+        FUENTES[tamaño] = fuente
+    return fuente
+
 # -------------------------------
 # Estados del juego
 # -------------------------------
@@ -80,6 +101,71 @@ RUTA_DB_APUNTE = os.path.join(RUTA_S10,"aim_scores.json")
 bd_reaccion = {"jugadores": {}}
 bd_apunte = {"jugadores": {}}
 
+# Clasificaciones ya ordenadas por modo; se invalidan al cargar o guardar
+_cache_puntajes = {}
+# Superficie con los marcadores ya dibujados; se invalida junto a las clasificaciones
+_marcador = None
+
+def invalidar_puntajes(modo):
+    """Descarta la clasificación cacheada de un modo y el marcador dibujado."""
+    global _marcador
+    _cache_puntajes.pop(modo, None)
+    _marcador = None
+
+# Último contenido escrito en cada ruta, para no repetir escrituras iguales
+_ultimo_guardado = {}
+
+# Se usa el json estándar: orjson no admite Infinity, que es el tiempo
+# guardado para jugadores sin marca
+_codificador_json = json.JSONEncoder(separators=(",",":"))
+
+def serializar_bd(datos):
+    """Convierte una base de datos a bytes JSON compactos."""
+    return _codificador_json.encode(datos).encode()
+
+def permisos_archivo(ruta):
+    """
+    Devuelve los permisos que debe tener el archivo guardado en ruta.
+    Se conservan los del archivo existente; si no existe se usan los que
+    tendría un archivo nuevo según la umask.
+    """
+    try:
+        return stat.S_IMODE(os.stat(ruta).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+def guardar_json(ruta, datos):
+    """
+    Guarda datos en JSON de forma atómica.
+    Se escribe en un temporal del mismo directorio y se reemplaza el archivo,
+    así un cierre inesperado nunca deja el archivo a medias.
+    Si el contenido no ha cambiado desde la última escritura no se hace nada.
+    """
+    contenido = serializar_bd(datos)
+    if _ultimo_guardado.get(ruta) == contenido:
+        return
+    fd, ruta_temporal = tempfile.mkstemp(dir=os.path.dirname(ruta) or ".", suffix=".tmp")
+    try:
+        f = os.fdopen(fd, "wb")
+    except:
+        os.close(fd)
+        os.remove(ruta_temporal)
+        raise
+    try:
+        with f:
+            f.write(contenido)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp crea el temporal con permisos 0600
+        os.chmod(ruta_temporal, permisos_archivo(ruta))
+        os.replace(ruta_temporal, ruta)
+    except:
+        os.remove(ruta_temporal)
+        raise
+    _ultimo_guardado[ruta] = contenido
+
 def cargar_bd_reaccion(): #Andrés Pérez Reyes
     """
     Carga la base de datos de tiempos de reacción desde JSON.
@@ -88,18 +174,21 @@ def cargar_bd_reaccion(): #Andrés Pérez Reyes
     if not os.path.exists(RUTA_DB_REACCION):
         guardar_bd_reaccion()
     try:
-        with open(RUTA_DB_REACCION,"r") as f:
-            bd_reaccion = json.load(f)
+        with open(RUTA_DB_REACCION,"rb") as f:
+            bd_reaccion = json.loads(f.read())
         if "jugadores" not in bd_reaccion:
             bd_reaccion = {"jugadores": {}}
+        else:
+            _ultimo_guardado[RUTA_DB_REACCION] = serializar_bd(bd_reaccion)
     except:
         bd_reaccion = {"jugadores": {}}
         guardar_bd_reaccion()
+    invalidar_puntajes("reaccion")
 
 def guardar_bd_reaccion(): #Andrés Pérez Reyes
     """Guarda la base de datos de tiempos de reacción en JSON."""
-    with open(RUTA_DB_REACCION,"w") as f:
-        json.dump(bd_reaccion,f,indent=4)
+    invalidar_puntajes("reaccion")
+    guardar_json(RUTA_DB_REACCION, bd_reaccion)
 
 def cargar_bd_apunte(): #JAVI
     """
@@ -109,29 +198,33 @@ def cargar_bd_apunte(): #JAVI
     if not os.path.exists(RUTA_DB_APUNTE):
         guardar_bd_apunte()
     try:
-        with open(RUTA_DB_APUNTE,"r") as f:
-            bd_apunte = json.load(f)
+        with open(RUTA_DB_APUNTE,"rb") as f:
+            bd_apunte = json.loads(f.read())
         if "jugadores" not in bd_apunte:
             bd_apunte = {"jugadores": {}}
+        else:
+            _ultimo_guardado[RUTA_DB_APUNTE] = serializar_bd(bd_apunte)
     except:
         bd_apunte = {"jugadores": {}}
         guardar_bd_apunte()
+    invalidar_puntajes("apunte")
 
 def guardar_bd_apunte(): #JAVI
     """Guarda la base de datos de puntuaciones de Aim Training."""
-    with open(RUTA_DB_APUNTE,"w") as f:
-        json.dump(bd_apunte,f,indent=4)
+    invalidar_puntajes("apunte")
+    guardar_json(RUTA_DB_APUNTE, bd_apunte)
 
 def registrar_usuario(nombre): #Andrés Pérez Reyes
     """
     Registra un usuario nuevo si no existe en ambas bases de datos.
+    Solo se guarda la base de datos que realmente cambia.
     """
     if nombre not in bd_reaccion["jugadores"]:
         bd_reaccion["jugadores"][nombre] = float("inf")
+        guardar_bd_reaccion()
     if nombre not in bd_apunte["jugadores"]:
         bd_apunte["jugadores"][nombre] = 0
-    guardar_bd_reaccion()
-    guardar_bd_apunte()
+        guardar_bd_apunte()
 
 def actualizar_tiempo(nombre, tiempo): #Andrés Pérez Reyes
     """
@@ -154,7 +247,11 @@ def actualizar_puntuacion_apunte(nombre, puntos): #JAVI
 def obtener_todos_los_puntajes(modo="reaccion"): #JAVI
     """
     Retorna todos los puntajes ordenados según modo.
+    La lista se calcula una vez y se reutiliza hasta el siguiente guardado.
     """
+    clave = "reaccion" if modo == "reaccion" else "apunte"
+    if clave in _cache_puntajes:
+        return _cache_puntajes[clave]
     if modo == "reaccion":
         jugadores = bd_reaccion["jugadores"]
         lista = [(jug, jugadores[jug] if jugadores[jug] != float("inf") else 9999) for jug in jugadores]
@@ -163,6 +260,7 @@ def obtener_todos_los_puntajes(modo="reaccion"): #JAVI
         jugadores = bd_apunte["jugadores"]
         lista = [(jug, jugadores[jug]) for jug in jugadores]
         lista.sort(key=lambda x: x[1], reverse=True)
+    _cache_puntajes[clave] = lista
     return lista
 
 cargar_bd_reaccion()
@@ -176,6 +274,7 @@ usuario = ""
 texto_entrada = ""
 mensaje = ""
 
+# Marcas de tiempo en milisegundos de pygame.time.get_ticks() (reloj monótono)
 tiempo_inicio = None
 tiempo_fin = None
 retraso_espera = None
@@ -193,29 +292,109 @@ VELOCIDAD_SCROLL = 40
 # -------------------------------
 # Funciones de interfaz
 # -------------------------------
-def dibujar_degradado(c1, c2):
-    """Dibuja un fondo degradado vertical."""
-    for y in range(ALTO):
-        r = int(c1[0]*(1 - y / (ALTO-1)) + c2[0] * (y / (ALTO-1)))
-        g = int(c1[1]*(1 - y / (ALTO-1)) + c2[1] * (y / (ALTO-1)))
-        b = int(c1[2]*(1 - y / (ALTO-1)) + c2[2] * (y / (ALTO-1)))
-        pygame.draw.line(pantalla, (r,g,b), (0,y), (ANCHO,y))
+_cache_degradados = {}
+
+def generar_degradado(c1, c2, tamaño):
+    """Genera una superficie con un degradado vertical entre dos colores."""
+    alto = tamaño[1]
+    # Se calcula una sola columna de un píxel y SDL la estira a lo ancho.
+    # Los colores se calculan con enteros y las filas iguales se rellenan juntas
+    columna = pygame.Surface((1, alto))
+    dr, dg, db = c2[0]-c1[0], c2[1]-c1[1], c2[2]-c1[2]
+    divisor = max(alto-1, 1)
+    inicio, color_tramo = 0, None
+    for y in range(alto):
+        color = (c1[0] + dr*y//divisor, c1[1] + dg*y//divisor, c1[2] + db*y//divisor)
+        if color != color_tramo:
+            if color_tramo is not None:
+                columna.fill(color_tramo, (0, inicio, 1, y - inicio))
+            inicio, color_tramo = y, color
+    columna.fill(color_tramo, (0, inicio, 1, alto - inicio))
+    return pygame.transform.scale(columna, tamaño).convert()
+
+def obtener_degradado(c1, c2):
+    """Devuelve el degradado de la pantalla para dos colores, generándolo si no existe."""
+    clave = (c1, c2, pantalla.get_size())
+    superficie = _cache_degradados.get(clave)
+    if superficie is None:
+        superficie = generar_degradado(c1, c2, pantalla.get_size())
+        _cache_degradados[clave] = superficie
+    return superficie
+
+def degradado_de(c1, c2):
+    """
+    Devuelve un fondo degradado vertical listo para volcar en pantalla.
+    El degradado se genera una sola vez por par de colores y se reutiliza.
+    """
+    return obtener_degradado(c1, c2), (0, 0)
+
+# Degradados usados por las pantallas, generados en la precarga
+COLORES_DEGRADADOS = [
+    ((20,20,20),(60,60,60)),
+    ((150,0,0),(80,0,0)),
+    ((0,160,100),(0,60,20)),
+    ((10,10,40),(0,0,0)),
+    ((30,30,30),(0,0,0)),
+    ((0,0,0),(40,40,40)),
+]
+
+@lru_cache(maxsize=256)
+def renderizar_texto(texto, tamaño, color):
+    """Renderiza un texto y guarda el resultado para reutilizarlo en otros frames."""
+    return obtener_fuente(tamaño).render(texto, True, color).convert_alpha()
 
 def texto_centrado(texto, y, tamaño=32, color=(255,255,255)):
-    """Dibuja texto centrado horizontalmente en la pantalla."""
-    fuente = FUENTES.get(tamaño, FUENTES[32])
-    renderizado = fuente.render(texto, True, color)
-    pantalla.blit(renderizado, renderizado.get_rect(center=(ANCHO//2, y)))
-
-def dibujar_boton(rect, texto):
-    """Dibuja un botón con texto, cambia de color al pasar el mouse."""
-    hover = rect.collidepoint(pygame.mouse.get_pos())
+    """
+    Devuelve un texto centrado horizontalmente listo para volcar en pantalla.
+    Si el texto está vacío devuelve None.
+    """
+    if not texto:
+        return None
+    renderizado = renderizar_texto(texto, tamaño, color)
+    return renderizado, renderizado.get_rect(center=(ANCHO//2, y))
+
+_cache_botones = {}
+
+def generar_boton(tamaño, texto, hover):
+    """Genera la superficie de un botón con su borde y su texto."""
+    superficie = pygame.Surface(tamaño, pygame.SRCALPHA)
+    rect = superficie.get_rect()
     color_fondo = (255,255,255) if hover else (200,200,200)
-    pygame.draw.rect(pantalla, color_fondo, rect, border_radius=15)
-    pygame.draw.rect(pantalla, (0,0,0), rect, 3, border_radius=15)
-    t = FUENTES[36].render(texto, True, (0,0,0))
-    pantalla.blit(t, t.get_rect(center=rect.center))
-    return hover
+    pygame.draw.rect(superficie, color_fondo, rect, border_radius=15)
+    pygame.draw.rect(superficie, (0,0,0), rect, 3, border_radius=15)
+    t = renderizar_texto(texto, 36, (0,0,0))
+    superficie.blit(t, t.get_rect(center=rect.center))
+    return superficie.convert_alpha()
+
+def obtener_boton(tamaño, texto, hover):
+    """Devuelve la superficie de un botón, generándola solo la primera vez."""
+    clave = (tuple(tamaño), texto, hover)
+    superficie = _cache_botones.get(clave)
+    if superficie is None:
+        superficie = generar_boton(tamaño, texto, hover)
+        _cache_botones[clave] = superficie
+    return superficie
+
+def boton_de(rect, texto):
+    """
+    Devuelve un botón con texto listo para volcar, resaltado al pasar el mouse.
+    Si el botón queda fuera de la zona visible devuelve None.
+    """
+    if not pantalla.get_clip().colliderect(rect):
+        return None
+    return obtener_boton(rect.size, texto, rect == boton_resaltado), rect.topleft
+
+def volcar(dibujos):
+    """
+    Dibuja en pantalla una lista de (superficie, destino) con una sola llamada.
+    Las entradas None (nada que dibujar) se ignoran.
+    fblits solo existe en pygame-ce; con pygame se usa blits.
+    """
+    dibujos = [d for d in dibujos if d is not None]
+    if hasattr(pantalla, "fblits"):
+        pantalla.fblits(dibujos)
+    else:
+        pantalla.blits(dibujos, doreturn=False)
 
 # -------------------------------
 # Manejo de eventos
@@ -241,12 +420,12 @@ def iniciar_espera():
     """Inicia la espera aleatoria antes de reaccionar."""
     global retraso_espera, inicio_retraso, estado
     retraso_espera = random.uniform(dificultad_actual.retraso_min, dificultad_actual.retraso_max)
-    inicio_retraso = time.time()
+    inicio_retraso = pygame.time.get_ticks()
     estado = EstadoJuego.ESPERANDO
 
 def actualizar_menu(evento):
     """Maneja eventos en el menú principal."""
-    global estado, mensaje, texto_entrada
+    global estado, texto_entrada
     if evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1:
         x,y = evento.pos
         if btn_puntuaciones.collidepoint(x,y):
@@ -284,8 +463,8 @@ def actualizar_click(evento):
     """Maneja eventos cuando se espera el clic de reacción."""
     global tiempo_fin, estado, mensaje
     if evento.type == pygame.MOUSEBUTTONDOWN:
-        tiempo_fin = time.time()
-        reaccion = round(tiempo_fin - tiempo_inicio, 3)
+        tiempo_fin = pygame.time.get_ticks()
+        reaccion = round((tiempo_fin - tiempo_inicio) / 1000, 3)
         if actualizar_tiempo(usuario, reaccion):
             mensaje = f"Nueva marca: {reaccion}s"
         else:
@@ -319,64 +498,107 @@ def actualizar_puntajes(evento):
 # -------------------------------
 # Dibujo pantallas
 # -------------------------------
+# Caja de texto de la pantalla de usuario, dibujada una sola vez
+caja_usuario = pygame.Surface((400, 50), pygame.SRCALPHA)
+pygame.draw.rect(caja_usuario,(255,255,255),caja_usuario.get_rect(), border_radius=15)
+caja_usuario = caja_usuario.convert_alpha()
+
 def dibujar_usuario():
     """Dibuja la pantalla de entrada de usuario."""
-    pantalla.blit(fondo_usuario, (0, 0))
-    texto_centrado("Introduce nombre de usuario:",300,48)
-    pygame.draw.rect(pantalla,(255,255,255),(ANCHO//2 -200, ALTO//2 -25, 400,50), border_radius=15)
-    txt = FUENTES[48].render(texto_entrada, True, (0,0,0))
-    pantalla.blit(txt, (ANCHO//2 - 180, ALTO//2 - 20))
+    # Con el campo vacío no hay texto que renderizar
+    entrada = None
+    if texto_entrada:
+        entrada = (renderizar_texto(texto_entrada, 48, (0,0,0)), (ANCHO//2 - 180, ALTO//2 - 20))
+    volcar([
+        (fondo_usuario, (0, 0)),
+        texto_centrado("Introduce nombre de usuario:",300,48),
+        (caja_usuario, (ANCHO//2 -200, ALTO//2 -25)),
+        entrada,
+    ])
 
 def dibujar_menu():
     """Dibuja el menú principal."""
-    pantalla.blit(fondo_menu, (0, 0))
-    texto_centrado("Demuestra tus reflejos",150,80)
-    dibujar_boton(btn_reaccion,"Modo Reacción")
-    dibujar_boton(btn_apunte,"Aim-Training")
-    dibujar_boton(btn_dificultad,"Cambiar Dificultad")
-    dibujar_boton(btn_puntuaciones,"Puntuaciones")
-    txt = FUENTES[36].render(f"Usuario: {usuario}", True, (255,255,255))
-    pantalla.blit(txt,(300,70))
+    txt = renderizar_texto(f"Usuario: {usuario}", 36, (255,255,255))
+    volcar([
+        (fondo_menu, (0, 0)),
+        texto_centrado("Demuestra tus reflejos",150,80),
+        boton_de(btn_reaccion,"Modo Reacción"),
+        boton_de(btn_apunte,"Aim-Training"),
+        boton_de(btn_dificultad,"Cambiar Dificultad"),
+        boton_de(btn_puntuaciones,"Puntuaciones"),
+        (txt,(300,70)),
+    ])
+
+# Altura y zona de la pantalla de espera que ocupan los puntos animados
+Y_PUNTOS_ESPERA = 600
+ZONA_PUNTOS_ESPERA = pygame.Rect(0, Y_PUNTOS_ESPERA - 60, ANCHO, 120)
+
+def puntos_espera():
+    """Devuelve cuántos puntos animados se muestran en la pantalla de espera."""
+    return (pygame.time.get_ticks() - inicio_retraso) // 500 % 4
 
 def dibujar_espera():
     """Dibuja pantalla de espera antes de reaccionar."""
-    dibujar_degradado((20,20,20),(60,60,60))
-    texto_centrado("¿PREPARADO?",500,64)
-    puntos = int((time.time() - inicio_retraso)*2)%4
-    texto_centrado("."*puntos,600,80)
+    puntos = puntos_espera()
+    volcar([
+        degradado_de((20,20,20),(60,60,60)),
+        texto_centrado("¿PREPARADO?",500,64),
+        texto_centrado("."*puntos,Y_PUNTOS_ESPERA,80),
+    ])
 
 def dibujar_click():
     """Dibuja la pantalla de clic de reacción."""
-    dibujar_degradado((150,0,0),(80,0,0))
-    texto_centrado("¡YA!",500,100)
-    texto_centrado("Pulsa rápido",650,48)
+    volcar([
+        degradado_de((150,0,0),(80,0,0)),
+        texto_centrado("¡YA!",500,100),
+        texto_centrado("Pulsa rápido",650,48),
+    ])
 
 def dibujar_resultado():
     """Dibuja pantalla de resultados de reacción."""
-    dibujar_degradado((0,160,100),(0,60,20))
-    reaccion = round(tiempo_fin - tiempo_inicio,3)
-    texto_centrado("Tiempo de reacción:",400,64)
-    texto_centrado(f"{reaccion} segundos",550,80)
-    texto_centrado(mensaje,650,48)
-    texto_centrado("Click o espacio para reiniciar",750,48)
-
-def dibujar_puntajes():
-    """Dibuja la pantalla de puntuaciones."""
-    global scroll_y
-    dibujar_degradado((10,10,40),(0,0,0))
-    y = 100 + scroll_y
-    texto_centrado("SCOREBOARD - REACCIÓN",y,64)
+    reaccion = round((tiempo_fin - tiempo_inicio) / 1000,3)
+    volcar([
+        degradado_de((0,160,100),(0,60,20)),
+        texto_centrado("Tiempo de reacción:",400,64),
+        texto_centrado(f"{reaccion} segundos",550,80),
+        texto_centrado(mensaje,650,48),
+        texto_centrado("Click o espacio para reiniciar",750,48),
+    ])
+
+def generar_marcador():
+    """Genera una única superficie con los dos marcadores completos."""
+    dibujos = []
+    y = 100
+    dibujos.append(texto_centrado("SCOREBOARD - REACCIÓN",y,64))
     y+=80
     for u,s in obtener_todos_los_puntajes("reaccion"):
-        texto_centrado(f"{u} - {round(s,3)} s",y,48)
+        dibujos.append(texto_centrado(f"{u} - {round(s,3)} s",y,48))
         y+=60
     y+=80
-    texto_centrado("SCOREBOARD - AIM TRAINING",y,64)
+    dibujos.append(texto_centrado("SCOREBOARD - AIM TRAINING",y,64))
     y+=80
     for u,s in obtener_todos_los_puntajes("apunte"):
-        texto_centrado(f"{u} - {round(s,2)} pts",y,48)
+        dibujos.append(texto_centrado(f"{u} - {round(s,2)} pts",y,48))
         y+=60
-    texto_centrado("Click o scroll para volver", ALTO-60,48)
+    alto = max(rect.bottom for _, rect in dibujos)
+    superficie = pygame.Surface((ANCHO, alto), pygame.SRCALPHA)
+    superficie.blits(dibujos, doreturn=False)
+    return superficie.convert_alpha()
+
+def obtener_marcador():
+    """Devuelve el marcador dibujado, regenerándolo solo si cambiaron los puntajes."""
+    global _marcador
+    if _marcador is None:
+        _marcador = generar_marcador()
+    return _marcador
+
+def dibujar_puntajes():
+    """Dibuja la pantalla de puntuaciones."""
+    volcar([
+        degradado_de((10,10,40),(0,0,0)),
+        (obtener_marcador(), (0, scroll_y)),
+        texto_centrado("Click o scroll para volver", ALTO-60,48),
+    ])
 
 # -------------------------------
 # Selector dificultad
@@ -394,12 +616,23 @@ def inicializar_ui_dificultad():
         y+=120
 inicializar_ui_dificultad()
 
+# Botones de las pantallas, generados en sus dos estados en la precarga
+BOTONES = [
+    (btn_reaccion, "Modo Reacción"),
+    (btn_apunte, "Aim-Training"),
+    (btn_dificultad, "Cambiar Dificultad"),
+    (btn_puntuaciones, "Puntuaciones"),
+] + [(rect, etiqueta) for etiqueta, rect in botones_dificultad]
+
 def dibujar_dificultad():
     """Dibuja pantalla de selección de dificultad."""
-    dibujar_degradado((30,30,30),(0,0,0))
-    texto_centrado("Selecciona dificultad",200,80)
+    dibujos = [
+        degradado_de((30,30,30),(0,0,0)),
+        texto_centrado("Selecciona dificultad",200,80),
+    ]
     for etiqueta, rect in botones_dificultad:
-        dibujar_boton(rect,etiqueta)
+        dibujos.append(boton_de(rect,etiqueta))
+    volcar(dibujos)
 
 def manejar_dificultad(evento):
     """Maneja eventos en pantalla de selección de dificultad."""
@@ -430,7 +663,7 @@ def iniciar_entrenamiento_apunte():
     puntuacion_apunte = 0
     circulos_clicados = 0
     circulo_apunte = generar_circulo()
-    inicio_circulo = time.time()
+    inicio_circulo = pygame.time.get_ticks()
     activo_apunte = True
 
 def generar_circulo():
@@ -451,7 +684,7 @@ def actualizar_apunte(evento):
     if evento.type == pygame.MOUSEBUTTONDOWN:
         mx,my = evento.pos
         if circulo_apunte.collidepoint(mx,my):
-            tiempo_reaccion = time.time()-inicio_circulo
+            tiempo_reaccion = (pygame.time.get_ticks()-inicio_circulo) / 1000
             puntos = max(0, round(10-tiempo_reaccion,2))
             puntuacion_apunte += puntos
             circulos_clicados += 1
@@ -461,7 +694,7 @@ def actualizar_apunte(evento):
                 estado = EstadoJuego.MENU
             else:
                 circulo_apunte = generar_circulo()
-                inicio_circulo = time.time()
+                inicio_circulo = pygame.time.get_ticks()
         else:
             puntuacion_apunte -= 5
             if puntuacion_apunte<0:
@@ -472,22 +705,77 @@ def actualizar_apunte(evento):
 
 def dibujar_apunte():
     """Dibuja pantalla de entrenamiento de puntería."""
-    dibujar_degradado((0,0,0),(40,40,40))
-    texto_centrado(f"Círculos restantes: {TOTAL_CIRCULOS-circulos_clicados}",100,64)
-    texto_centrado(f"Puntuación: {round(puntuacion_apunte,2)}",200,48)
+    dibujos = [
+        degradado_de((0,0,0),(40,40,40)),
+        texto_centrado(f"Círculos restantes: {TOTAL_CIRCULOS-circulos_clicados}",100,64),
+        texto_centrado(f"Puntuación: {round(puntuacion_apunte,2)}",200,48),
+    ]
     if circulo_apunte:
-        pantalla.blit(imagen_circulo, circulo_apunte.topleft)
-    texto_centrado("Haz click en el círculo lo más rápido posible",300,48)
+        dibujos.append((imagen_circulo, circulo_apunte.topleft))
+    dibujos.append(texto_centrado("Haz click en el círculo lo más rápido posible",300,48))
+    volcar(dibujos)
+
+# -------------------------------
+# Precarga repartida entre frames
+# -------------------------------
+def tareas_precarga():
+    """
+    Genera degradados y botones de uno en uno.
+    Cada paso se ejecuta en un frame distinto mientras se muestra la pantalla
+    de usuario, que no necesita nada de esto, así que el primer frame no espera.
+    Si una pantalla los pide antes, se generan en ese momento igualmente.
+    """
+    for c1, c2 in COLORES_DEGRADADOS:
+        yield obtener_degradado(c1, c2)
+    for rect, texto in BOTONES:
+        obtener_boton(rect.size, texto, False)
+        yield obtener_boton(rect.size, texto, True)
+
+precarga = tareas_precarga()
 
 # -------------------------------
 # Bucle principal
 # -------------------------------
+def botones_visibles():
+    """Devuelve los rectángulos de los botones de la pantalla actual."""
+    if estado == EstadoJuego.MENU:
+        return [btn_reaccion, btn_apunte, btn_dificultad, btn_puntuaciones]
+    if estado == EstadoJuego.SELECCION_DIFICULTAD:
+        return [rect for _, rect in botones_dificultad]
+    return []
+
+def boton_bajo_raton():
+    """
+    Devuelve el botón que está bajo el ratón, o None.
+    En pantallas sin botones no se consulta la posición del ratón.
+    """
+    botones = botones_visibles()
+    if not botones:
+        return None
+    posicion = pygame.mouse.get_pos()
+    for rect in botones:
+        if rect.collidepoint(posicion):
+            return rect
+    return None
+
 ejecutando = True
+# Zonas de la pantalla que hay que actualizar en este frame
+zonas_sucias = [pantalla.get_rect()]
+estado_anterior = None
+hover_anterior = None
+boton_resaltado = None
+puntos_anterior = None
 while ejecutando:
-    for evento in pygame.event.get():
+    # Espera a un evento (máximo un frame) en lugar de sondear continuamente
+    evento = pygame.event.wait(16)
+    eventos = pygame.event.get()
+    if evento.type != pygame.NOEVENT:
+        eventos.insert(0, evento)
+    for evento in eventos:
         if evento.type == pygame.QUIT:
             ejecutando = False
             break
+        zonas_sucias = [pantalla.get_rect()]
         if estado == EstadoJuego.USUARIO:
             actualizar_usuario(evento)
         elif estado == EstadoJuego.MENU:
@@ -504,30 +792,52 @@ while ejecutando:
             manejar_dificultad(evento)
         elif estado == EstadoJuego.ENTRENAMIENTO_APUNTE:
             actualizar_apunte(evento)
+    if not ejecutando:
+        break
 
     # Verifica si terminó el tiempo de espera para iniciar clic
     if estado == EstadoJuego.ESPERANDO:
-        if inicio_retraso and time.time()-inicio_retraso >= retraso_espera:
-            tiempo_inicio = time.time()
+        ahora = pygame.time.get_ticks()
+        if inicio_retraso is not None and ahora - inicio_retraso >= retraso_espera * 1000:
+            tiempo_inicio = ahora
             estado = EstadoJuego.CLIC
-
-    # Dibujar según estado
-    if estado == EstadoJuego.USUARIO:
-        dibujar_usuario()
-    elif estado == EstadoJuego.MENU:
-        dibujar_menu()
-    elif estado == EstadoJuego.ESPERANDO:
-        dibujar_espera()
-    elif estado == EstadoJuego.CLIC:
-        dibujar_click()
-    elif estado == EstadoJuego.RESULTADO:
-        dibujar_resultado()
-    elif estado == EstadoJuego.PUNTUACIONES:
-        dibujar_puntajes()
-    elif estado == EstadoJuego.SELECCION_DIFICULTAD:
-        dibujar_dificultad()
-    elif estado == EstadoJuego.ENTRENAMIENTO_APUNTE:
-        dibujar_apunte()
-
-    pygame.display.update()
-    reloj.tick(60)
\ No newline at end of file
+        # Los puntos de espera solo se actualizan cuando cambian
+        puntos = puntos_espera()
+        if puntos != puntos_anterior:
+            zonas_sucias.append(ZONA_PUNTOS_ESPERA)
+            puntos_anterior = puntos
+
+    # Solo se redibuja si cambia el estado, el botón resaltado o llega un evento
+    boton_resaltado = boton_bajo_raton()
+    if estado != estado_anterior:
+        zonas_sucias = [pantalla.get_rect()]
+    elif boton_resaltado != hover_anterior:
+        zonas_sucias += [r.inflate(4, 4) for r in (hover_anterior, boton_resaltado) if r]
+    estado_anterior = estado
+    hover_anterior = boton_resaltado
+
+    if zonas_sucias:
+        # Dibujar según estado
+        if estado == EstadoJuego.USUARIO:
+            dibujar_usuario()
+        elif estado == EstadoJuego.MENU:
+            dibujar_menu()
+        elif estado == EstadoJuego.ESPERANDO:
+            dibujar_espera()
+        elif estado == EstadoJuego.CLIC:
+            dibujar_click()
+        elif estado == EstadoJuego.RESULTADO:
+            dibujar_resultado()
+        elif estado == EstadoJuego.PUNTUACIONES:
+            dibujar_puntajes()
+        elif estado == EstadoJuego.SELECCION_DIFICULTAD:
+            dibujar_dificultad()
+        elif estado == EstadoJuego.ENTRENAMIENTO_APUNTE:
+            dibujar_apunte()
+
+        pygame.display.update(zonas_sucias)
+        zonas_sucias = []
+    # Un paso de la precarga por frame, después de mostrar el actual
+    if precarga is not None and next(precarga, None) is None:
+        precarga = None
+    reloj.tick(60)